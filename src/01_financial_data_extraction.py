@@ -8,8 +8,75 @@ Description: Extract and validate multi-year financial data from various sources
 import pandas as pd
 import numpy as np
 from datetime import datetime
-import warnings
-warnings.filterwarnings('ignore')
+from typing import Dict, List, Tuple
+import os
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # Optional: CSVs are written with pandas instead
+    pa = None
+
+log = logging.getLogger(__name__)
+
+
+def _write_csv(df: pd.DataFrame, filename: str) -> None:
+    """
+    Write one frame to CSV, using pyarrow's multi-threaded writer when available
+    """
+    if pa is not None:
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), filename)
+    else:
+        df.to_csv(filename, index=False)
+
+
+def _write_csv_batch(jobs: Dict[str, pd.DataFrame]) -> None:
+    """
+    Write {filename: DataFrame} jobs concurrently; CSV encoding releases the GIL
+    """
+    if not jobs:
+        return
+    with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+        # list() re-raises the first write error, if any
+        list(pool.map(_write_csv, jobs.values(), jobs.keys()))
+
+
+def _allocate_block(raw_data: Dict[str, List], derived: List[str]) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Allocate one column-major float64 block for raw and derived columns
+    Returns: (block, column views) - writing to a view fills the block in place
+    """
+    names = [name for name in raw_data if name != 'Year'] + derived
+    data = np.empty((len(raw_data['Year']), len(names)), order='F')
+    col = dict(zip(names, data.T))
+    
+    for name, values in raw_data.items():
+        if name != 'Year':
+            col[name][:] = values
+    
+    return data, col
+
+
+def _pct_change(v: np.ndarray) -> np.ndarray:
+    """
+    Period-over-period % change; the first period has no prior value and is NaN
+    """
+    out = np.empty_like(v, dtype=np.float64)
+    out[:1] = np.nan
+    out[1:] = (v[1:] / v[:-1] - 1.0) * 100.0
+    return out
+
+
+def _wrap_block(years: List[int], data: np.ndarray, col: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """
+    Wrap a filled block in a DataFrame without copying, with Year as the first column
+    """
+    df = pd.DataFrame(data, columns=list(col), copy=False)
+    df.insert(0, 'Year', years)
+    return df
+
 
 class FinancialDataExtractor:
     """
@@ -29,7 +96,7 @@ class FinancialDataExtractor:
         Load and structure income statement data for 4-year period
         Returns: DataFrame with key revenue and profitability metrics
         """
-        print("Loading income statements (2015-2018)...")
+        log.debug("Loading income statements (2015-2018)...")
         
         # Income statement data structure
         income_data = {
@@ -44,16 +111,18 @@ class FinancialDataExtractor:
             'Net_Income': [2.5, 18.4, 14.7, 2.2]
         }
         
-        df = pd.DataFrame(income_data)
+        data, col = _allocate_block(income_data, ['Gross_Margin', 'EBIT_Margin', 'Net_Margin', 'Revenue_Growth'])
         
         # Calculate key ratios
-        df['Gross_Margin'] = (df['Gross_Profit'] / df['Revenue']) * 100
-        df['EBIT_Margin'] = (df['EBIT'] / df['Revenue']) * 100
-        df['Net_Margin'] = (df['Net_Income'] / df['Revenue']) * 100
-        df['Revenue_Growth'] = df['Revenue'].pct_change() * 100
+        col['Gross_Margin'][:] = col['Gross_Profit'] / col['Revenue'] * 100
+        col['EBIT_Margin'][:] = col['EBIT'] / col['Revenue'] * 100
+        col['Net_Margin'][:] = col['Net_Income'] / col['Revenue'] * 100
+        col['Revenue_Growth'][:] = _pct_change(col['Revenue'])
+        
+        df = _wrap_block(income_data['Year'], data, col)
         
         self.financial_data['income_statement'] = df
-        print(f"✓ Loaded income statements: {len(df)} years")
+        log.debug("✓ Loaded income statements: %d years", len(df))
         return df
     
     def load_balance_sheets(self):
@@ -61,7 +130,7 @@ class FinancialDataExtractor:
         Load balance sheet data including assets, liabilities, equity
         Returns: DataFrame with balance sheet items
         """
-        print("Loading balance sheets...")
+        log.debug("Loading balance sheets...")
         
         balance_data = {
             'Year': [2015, 2016, 2017, 2018],
@@ -74,15 +143,17 @@ class FinancialDataExtractor:
             'Shareholders_Equity': [300.0, 300.0, 280.0, 160.0]
         }
         
-        df = pd.DataFrame(balance_data)
+        data, col = _allocate_block(balance_data, ['Current_Ratio', 'Debt_to_Equity', 'Asset_Turnover'])
         
         # Calculate liquidity and leverage ratios
-        df['Current_Ratio'] = df['Current_Assets'] / df['Current_Liabilities']
-        df['Debt_to_Equity'] = df['Long_Term_Debt'] / df['Shareholders_Equity']
-        df['Asset_Turnover'] = [784.9/1250, 826.6/1320, 836.3/1290, 573.1/980]
+        col['Current_Ratio'][:] = col['Current_Assets'] / col['Current_Liabilities']
+        col['Debt_to_Equity'][:] = col['Long_Term_Debt'] / col['Shareholders_Equity']
+        col['Asset_Turnover'][:] = np.array([784.9, 826.6, 836.3, 573.1]) / col['Total_Assets']
+        
+        df = _wrap_block(balance_data['Year'], data, col)
         
         self.financial_data['balance_sheet'] = df
-        print(f"✓ Loaded balance sheets: {len(df)} years")
+        log.debug("✓ Loaded balance sheets: %d years", len(df))
         return df
     
     def calculate_cash_flow_metrics(self):
@@ -90,7 +161,7 @@ class FinancialDataExtractor:
         Calculate operating, investing, and financing cash flows
         Returns: DataFrame with cash flow analysis
         """
-        print("Calculating cash flow metrics...")
+        log.debug("Calculating cash flow metrics...")
         
         cash_flow_data = {
             'Year': [2015, 2016, 2017, 2018],
@@ -101,15 +172,17 @@ class FinancialDataExtractor:
             'Free_Cash_Flow': [10.0, 10.0, 10.0, 3.0]
         }
         
-        df = pd.DataFrame(cash_flow_data)
+        data, col = _allocate_block(cash_flow_data, ['OCF_to_NI', 'FCF_Margin'])
         
         # Calculate cash flow ratios
-        net_income = [2.5, 18.4, 14.7, 2.2]
-        df['OCF_to_NI'] = df['Operating_Cash_Flow'] / net_income
-        df['FCF_Margin'] = (df['Free_Cash_Flow'] / [784.9, 826.6, 836.3, 573.1]) * 100
+        net_income = np.array([2.5, 18.4, 14.7, 2.2])
+        col['OCF_to_NI'][:] = col['Operating_Cash_Flow'] / net_income
+        col['FCF_Margin'][:] = col['Free_Cash_Flow'] / np.array([784.9, 826.6, 836.3, 573.1]) * 100
+        
+        df = _wrap_block(cash_flow_data['Year'], data, col)
         
         self.financial_data['cash_flow'] = df
-        print(f"✓ Calculated cash flows: {len(df)} years")
+        log.debug("✓ Calculated cash flows: %d years", len(df))
         return df
     
     def validate_data_quality(self):
@@ -117,7 +190,7 @@ class FinancialDataExtractor:
         Perform data quality checks and validation
         Returns: Dictionary with validation results
         """
-        print("\nValidating data quality...")
+        log.debug("Validating data quality...")
         
         validation_results = {
             'completeness': True,
@@ -128,21 +201,23 @@ class FinancialDataExtractor:
         
         # Check for missing values
         for name, df in self.financial_data.items():
-            if df.isnull().sum().sum() > 0:
+            if df.isna().values.any():
                 validation_results['completeness'] = False
                 validation_results['issues'].append(f"Missing values in {name}")
         
         # Check balance sheet equation: Assets = Liabilities + Equity
         bs = self.financial_data.get('balance_sheet')
         if bs is not None:
-            for idx, row in bs.iterrows():
-                assets = row['Total_Assets']
-                liabilities_equity = row['Total_Liabilities'] + row['Shareholders_Equity']
-                if abs(assets - liabilities_equity) > 1:  # Allow small rounding differences
-                    validation_results['consistency'] = False
-                    validation_results['issues'].append(f"Balance sheet imbalance in {row['Year']}")
-        
-        print("✓ Data validation complete")
+            diff = np.subtract(bs['Total_Assets'].values, bs['Total_Liabilities'].values)
+            np.subtract(diff, bs['Shareholders_Equity'].values, out=diff)
+            bad = np.abs(diff) > 1  # Allow small rounding differences
+            if bad.any():
+                validation_results['consistency'] = False
+                validation_results['issues'].extend(
+                    [f"Balance sheet imbalance in {year}" for year in bs['Year'].values[bad].tolist()]
+                )
+        
+        log.debug("✓ Data validation complete")
         return validation_results
     
     def generate_summary_statistics(self):
@@ -150,46 +225,63 @@ class FinancialDataExtractor:
         Generate comprehensive summary statistics across all financial data
         Returns: Dictionary with summary metrics
         """
-        print("\nGenerating summary statistics...")
+        log.debug("Generating summary statistics...")
         
         summary = {}
         
         # Revenue analysis
         income = self.financial_data.get('income_statement')
         if income is not None:
+            rev = income['Revenue'].to_numpy()
             summary['revenue'] = {
-                'mean': income['Revenue'].mean(),
-                'std': income['Revenue'].std(),
-                'min': income['Revenue'].min(),
-                'max': income['Revenue'].max(),
-                'total_change': income['Revenue'].iloc[-1] - income['Revenue'].iloc[0],
-                'pct_change': ((income['Revenue'].iloc[-1] / income['Revenue'].iloc[0]) - 1) * 100
+                'mean': rev.mean(),
+                'std': rev.std(ddof=1),  # sample std, as pandas reports it
+                'min': rev.min(),
+                'max': rev.max(),
+                'total_change': rev[-1] - rev[0],
+                'pct_change': ((rev[-1] / rev[0]) - 1) * 100
             }
             
+            # The margin columns share one block, so this is a single 2-D reduction
+            margins = income[['Gross_Margin', 'EBIT_Margin', 'Net_Margin']].to_numpy()
+            avg_gross, avg_ebit, avg_net = np.nanmean(margins, axis=0)
             summary['profitability'] = {
-                'avg_gross_margin': income['Gross_Margin'].mean(),
-                'avg_ebit_margin': income['EBIT_Margin'].mean(),
-                'avg_net_margin': income['Net_Margin'].mean()
+                'avg_gross_margin': avg_gross,
+                'avg_ebit_margin': avg_ebit,
+                'avg_net_margin': avg_net
             }
         
-        print("✓ Summary statistics generated")
+        log.debug("✓ Summary statistics generated")
         return summary
     
+    def to_arrow(self, name='income_statement') -> 'pa.RecordBatch':
+        """
+        Expose a loaded statement as an Arrow record batch (requires pyarrow)
+        Float columns without missing values share memory with the DataFrame block
+        """
+        if pa is None:
+            raise ImportError("to_arrow requires pyarrow")
+        return pa.RecordBatch.from_pandas(self.financial_data[name], preserve_index=False)
+    
     def export_processed_data(self, output_path='data/processed/'):
         """
         Export all processed financial data to CSV files
         """
-        print("\nExporting processed data...")
+        log.info("Exporting processed data...")
         
-        for name, df in self.financial_data.items():
-            filename = f"{output_path}{name}.csv"
-            # df.to_csv(filename, index=False)
-            print(f"✓ Exported {name} to {filename}")
+        jobs = {f"{output_path}{name}.csv": df for name, df in self.financial_data.items()}
+        # _write_csv_batch(jobs)
+        for name, filename in zip(self.financial_data, jobs):
+            log.info("✓ Exported %s to %s", name, filename)
         
-        print("\n=== Data extraction complete ===")
+        log.info("=== Data extraction complete ===")
 
 
 if __name__ == "__main__":
+    # Show progress from every step, not just the export summary
+    logging.basicConfig(format='%(message)s')
+    log.setLevel(logging.DEBUG)
+    
     print("="*60)
     print("House of Fraser Financial Data Extraction")
     print("="*60)
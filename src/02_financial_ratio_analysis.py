@@ -9,9 +9,227 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from typing import Dict, List, Tuple
-import warnings
-warnings.filterwarnings('ignore')
+from typing import Dict, List, NamedTuple, Tuple, Union
+import os
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # Optional: CSVs are written with pandas instead; no Parquet export
+    pa = None
+
+try:
+    import polars as pl
+except ImportError:  # Optional: only needed to pass Polars frames to the analyzer
+    pl = None
+
+log = logging.getLogger(__name__)
+
+# Frames with at least this many rows compute DuPont ROE with one fused pandas.eval kernel
+EVAL_MIN_ROWS = 1000
+
+
+def _write_csv(df: pd.DataFrame, filename: str) -> None:
+    """
+    Write one frame to CSV, using pyarrow's multi-threaded writer when available
+    """
+    if pa is not None:
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), filename)
+    else:
+        df.to_csv(filename, index=False)
+
+
+def _write_parquet(df: pd.DataFrame, filename: str) -> None:
+    """
+    Write one frame to a Snappy-compressed Parquet file (requires pyarrow)
+    """
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), filename, compression='snappy')
+
+
+def _write_batch(jobs: Dict[str, pd.DataFrame], writer=_write_csv) -> None:
+    """
+    Write {filename: DataFrame} jobs concurrently; CSV and Parquet encoding release the GIL
+    """
+    if not jobs:
+        return
+    with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+        # list() re-raises the first write error, if any
+        list(pool.map(writer, jobs.values(), jobs.keys()))
+
+
+def _add_dupont_roe(dupont: pd.DataFrame) -> None:
+    """
+    Add ROE_Calculated_% (Net Margin × Asset Turnover × Equity Multiplier) in place
+    """
+    if len(dupont) >= EVAL_MIN_ROWS:
+        dupont['ROE_Calculated_%'] = dupont.eval(
+            '`Net_Margin_%` / 100 * Asset_Turnover * Equity_Multiplier * 100'
+        )
+    else:
+        dupont['ROE_Calculated_%'] = (
+            dupont['Net_Margin_%'].to_numpy() / 100 *
+            dupont['Asset_Turnover'].to_numpy() *
+            dupont['Equity_Multiplier'].to_numpy()
+        ) * 100
+
+
+def _as_pandas(frame: Union[pd.DataFrame, 'pl.DataFrame']) -> pd.DataFrame:
+    """
+    Adopt a Polars frame column by column through NumPy; pandas frames pass through
+    """
+    if pl is not None and isinstance(frame, pl.DataFrame):
+        return pd.DataFrame({name: frame[name].to_numpy() for name in frame.columns})
+    return frame
+
+
+def _safe_divide(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    """
+    Element-wise num / den that is NaN (rather than inf, with a warning) where den is zero
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.divide(num, den, out=np.full(np.shape(num), np.nan), where=den != 0)
+
+
+def _pct_change(v: np.ndarray) -> np.ndarray:
+    """
+    Period-over-period % change; the first period has no prior value and is NaN
+    """
+    out = np.empty_like(v, dtype=np.float64)
+    out[:1] = np.nan
+    out[1:] = (v[1:] / v[:-1] - 1.0) * 100.0
+    return out
+
+
+def _classify_trends(mat: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Classify each column by relative change between its first and last non-NaN values
+    Returns: (codes, counted) - codes are 1 improving, -1 declining, 0 stable;
+    counted is False for columns with fewer than two values
+    """
+    valid = ~np.isnan(mat)
+    cols = np.arange(mat.shape[1])
+    first = mat[valid.argmax(axis=0), cols]
+    last = mat[mat.shape[0] - 1 - valid[::-1].argmax(axis=0), cols]
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        trend = np.where(first != 0, (last - first) / np.abs(first), 0.0)
+    
+    codes = np.zeros(mat.shape[1], dtype=np.int8)
+    codes[trend > threshold] = 1
+    codes[trend < -threshold] = -1
+    return codes, valid.sum(axis=0) > 1
+
+
+# Column order of the ratio block written by _ratios_kernel
+RATIO_COLUMNS = [
+    'gross_margin', 'ebit_margin', 'net_margin', 'roa', 'roe',
+    'current_ratio', 'working_capital', 'wc_to_revenue',
+    'debt_to_equity', 'debt_to_assets', 'equity_multiplier', 'interest_coverage',
+    'asset_turnover', 'fixed_asset_turnover', 'asset_turnover_change'
+]
+
+
+def _ratios_kernel(rev, gp, ebit, intx, ni, ta, ca, fa, cl, ltd, eq) -> np.ndarray:
+    """
+    Compute every analyzer ratio from the statement columns in one pass
+    Returns: column-major (years x RATIO_COLUMNS) float64 block
+    """
+    out = np.empty((len(rev), len(RATIO_COLUMNS)), order='F')
+    col = dict(zip(RATIO_COLUMNS, out.T))
+    
+    # Profitability (%)
+    col['gross_margin'][:] = _safe_divide(gp, rev) * 100
+    col['ebit_margin'][:] = _safe_divide(ebit, rev) * 100
+    col['net_margin'][:] = _safe_divide(ni, rev) * 100
+    col['roa'][:] = _safe_divide(ni, ta) * 100
+    col['roe'][:] = _safe_divide(ni, eq) * 100
+    
+    # Liquidity
+    col['current_ratio'][:] = _safe_divide(ca, cl)
+    col['working_capital'][:] = ca - cl
+    col['wc_to_revenue'][:] = _safe_divide(col['working_capital'], rev) * 100
+    
+    # Leverage
+    col['debt_to_equity'][:] = _safe_divide(ltd, eq)
+    col['debt_to_assets'][:] = _safe_divide(ltd, ta)
+    col['equity_multiplier'][:] = _safe_divide(ta, eq)
+    col['interest_coverage'][:] = _safe_divide(ebit, intx)
+    
+    # Efficiency
+    col['asset_turnover'][:] = _safe_divide(rev, ta)
+    col['fixed_asset_turnover'][:] = _safe_divide(rev, fa)
+    col['asset_turnover_change'][:] = _pct_change(col['asset_turnover'])
+    
+    return out
+
+
+# FinancialArrays field -> (statement, column) it is read from
+STATEMENT_COLUMNS = {
+    'year': ('income', 'Year'),
+    'revenue': ('income', 'Revenue'),
+    'gross_profit': ('income', 'Gross_Profit'),
+    'ebit': ('income', 'EBIT'),
+    'interest_expense': ('income', 'Interest_Expense'),
+    'net_income': ('income', 'Net_Income'),
+    'total_assets': ('balance', 'Total_Assets'),
+    'current_assets': ('balance', 'Current_Assets'),
+    'fixed_assets': ('balance', 'Fixed_Assets'),
+    'current_liabilities': ('balance', 'Current_Liabilities'),
+    'long_term_debt': ('balance', 'Long_Term_Debt'),
+    'shareholders_equity': ('balance', 'Shareholders_Equity')
+}
+
+
+class FinancialArrays(NamedTuple):
+    """
+    Statement columns the ratio analysis needs, one array per line item
+    """
+    year: np.ndarray
+    revenue: np.ndarray
+    gross_profit: np.ndarray
+    ebit: np.ndarray
+    interest_expense: np.ndarray
+    net_income: np.ndarray
+    total_assets: np.ndarray
+    current_assets: np.ndarray
+    fixed_assets: np.ndarray
+    current_liabilities: np.ndarray
+    long_term_debt: np.ndarray
+    shareholders_equity: np.ndarray
+    
+    @classmethod
+    def from_statements(cls, income, balance) -> 'FinancialArrays':
+        """
+        Pick the analysis columns out of two statements indexable by column name
+        (record arrays, Arrow record batches, ...)
+        """
+        tables = {'income': income, 'balance': balance}
+        
+        # Income statement years are the single year axis for every ratio frame
+        if not np.array_equal(np.asarray(income['Year']), np.asarray(balance['Year'])):
+            raise ValueError("Income statement and balance sheet years do not match")
+        
+        return cls.from_columns(**{
+            field: np.asarray(tables[table][column])
+            for field, (table, column) in STATEMENT_COLUMNS.items()
+        })
+    
+    @classmethod
+    def from_columns(cls, year, **columns) -> 'FinancialArrays':
+        """
+        Coerce columns to contiguous float64 arrays; arrays that already are pass through uncopied
+        """
+        lengths = {len(year)} | {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Statement columns cover different periods (lengths {sorted(lengths)})")
+        return cls(
+            year=np.ascontiguousarray(year),
+            **{name: np.ascontiguousarray(values, dtype=np.float64) for name, values in columns.items()}
+        )
+
 
 class FinancialRatioAnalyzer:
     """
@@ -22,10 +240,58 @@ class FinancialRatioAnalyzer:
     - Efficiency ratios
     """
     
-    def __init__(self, income_statement: pd.DataFrame, balance_sheet: pd.DataFrame):
+    def __init__(self, income_statement: Union[pd.DataFrame, 'pl.DataFrame'],
+                 balance_sheet: Union[pd.DataFrame, 'pl.DataFrame']):
+        # Polars input is converted once here; every ratio below runs on NumPy arrays
+        income_statement = _as_pandas(income_statement)
+        balance_sheet = _as_pandas(balance_sheet)
+        
         self.income = income_statement
         self.balance = balance_sheet
         self.ratios = {}
+        self._ratios_cache: Dict[str, np.ndarray] = {}
+        
+        # Record arrays give column access without pandas indexing
+        self._arr = FinancialArrays.from_statements(
+            self.income.to_records(index=False),
+            self.balance.to_records(index=False)
+        )
+    
+    @classmethod
+    def from_arrays(cls, arrays: 'FinancialArrays') -> 'FinancialRatioAnalyzer':
+        """
+        Build an analyzer straight from statement arrays, skipping the DataFrame round trip
+        self.income and self.balance are None for analyzers built this way
+        """
+        analyzer = cls.__new__(cls)
+        analyzer.income = None
+        analyzer.balance = None
+        analyzer.ratios = {}
+        analyzer._ratios_cache = {}
+        analyzer._arr = FinancialArrays.from_columns(**arrays._asdict())
+        return analyzer
+    
+    @classmethod
+    def from_arrow(cls, income_batch: 'pa.RecordBatch', balance_batch: 'pa.RecordBatch') -> 'FinancialRatioAnalyzer':
+        """
+        Build an analyzer from Arrow record batches, e.g. FinancialDataExtractor.to_arrow()
+        Null-free numeric columns are adopted without copying
+        """
+        return cls.from_arrays(FinancialArrays.from_statements(income_batch, balance_batch))
+    
+    def _get(self, name: str) -> np.ndarray:
+        """
+        Return one ratio column; the first call computes every ratio in a single kernel pass
+        """
+        if not self._ratios_cache:
+            a = self._arr
+            block = _ratios_kernel(
+                a.revenue, a.gross_profit, a.ebit, a.interest_expense, a.net_income,
+                a.total_assets, a.current_assets, a.fixed_assets, a.current_liabilities,
+                a.long_term_debt, a.shareholders_equity
+            )
+            self._ratios_cache = dict(zip(RATIO_COLUMNS, block.T))
+        return self._ratios_cache[name]
         
     def calculate_profitability_ratios(self) -> Dict:
         """
@@ -36,21 +302,19 @@ class FinancialRatioAnalyzer:
         - Return on Assets (ROA)
         - Return on Equity (ROE)
         """
-        print("Calculating profitability ratios...")
+        log.debug("Calculating profitability ratios...")
         
         profitability = pd.DataFrame({
-            'Year': self.income['Year'],
-            'Gross_Margin_%': (self.income['Gross_Profit'] / self.income['Revenue']) * 100,
-            'EBIT_Margin_%': (self.income['EBIT'] / self.income['Revenue']) * 100,
-            'Net_Margin_%': (self.income['Net_Income'] / self.income['Revenue']) * 100
+            'Year': self._arr.year,
+            'Gross_Margin_%': self._get('gross_margin'),
+            'EBIT_Margin_%': self._get('ebit_margin'),
+            'Net_Margin_%': self._get('net_margin'),
+            'ROA_%': self._get('roa'),
+            'ROE_%': self._get('roe')
         })
         
-        # ROA and ROE
-        profitability['ROA_%'] = (self.income['Net_Income'] / self.balance['Total_Assets']) * 100
-        profitability['ROE_%'] = (self.income['Net_Income'] / self.balance['Shareholders_Equity']) * 100
-        
         self.ratios['profitability'] = profitability
-        print("✓ Profitability ratios calculated")
+        log.debug("✓ Profitability ratios calculated")
         return profitability
     
     def calculate_liquidity_ratios(self) -> Dict:
@@ -60,19 +324,17 @@ class FinancialRatioAnalyzer:
         - Quick ratio (if data available)
         - Working capital
         """
-        print("Calculating liquidity ratios...")
+        log.debug("Calculating liquidity ratios...")
         
         liquidity = pd.DataFrame({
-            'Year': self.balance['Year'],
-            'Current_Ratio': self.balance['Current_Assets'] / self.balance['Current_Liabilities'],
-            'Working_Capital': self.balance['Current_Assets'] - self.balance['Current_Liabilities']
+            'Year': self._arr.year,
+            'Current_Ratio': self._get('current_ratio'),
+            'Working_Capital': self._get('working_capital'),
+            'WC_to_Revenue_%': self._get('wc_to_revenue')
         })
         
-        # Calculate working capital as % of revenue
-        liquidity['WC_to_Revenue_%'] = (liquidity['Working_Capital'] / self.income['Revenue']) * 100
-        
         self.ratios['liquidity'] = liquidity
-        print("✓ Liquidity ratios calculated")
+        log.debug("✓ Liquidity ratios calculated")
         return liquidity
     
     def calculate_leverage_ratios(self) -> Dict:
@@ -83,20 +345,18 @@ class FinancialRatioAnalyzer:
         - Interest coverage ratio
         - Equity multiplier
         """
-        print("Calculating leverage ratios...")
+        log.debug("Calculating leverage ratios...")
         
         leverage = pd.DataFrame({
-            'Year': self.balance['Year'],
-            'Debt_to_Equity': self.balance['Long_Term_Debt'] / self.balance['Shareholders_Equity'],
-            'Debt_to_Assets': self.balance['Long_Term_Debt'] / self.balance['Total_Assets'],
-            'Equity_Multiplier': self.balance['Total_Assets'] / self.balance['Shareholders_Equity']
+            'Year': self._arr.year,
+            'Debt_to_Equity': self._get('debt_to_equity'),
+            'Debt_to_Assets': self._get('debt_to_assets'),
+            'Equity_Multiplier': self._get('equity_multiplier'),
+            'Interest_Coverage': self._get('interest_coverage')
         })
         
-        # Interest coverage ratio (EBIT / Interest Expense)
-        leverage['Interest_Coverage'] = self.income['EBIT'] / self.income['Interest_Expense']
-        
         self.ratios['leverage'] = leverage
-        print("✓ Leverage ratios calculated")
+        log.debug("✓ Leverage ratios calculated")
         return leverage
     
     def calculate_efficiency_ratios(self) -> Dict:
@@ -106,53 +366,57 @@ class FinancialRatioAnalyzer:
         - Inventory turnover (if data available)
         - Days sales outstanding
         """
-        print("Calculating efficiency ratios...")
+        log.debug("Calculating efficiency ratios...")
         
         efficiency = pd.DataFrame({
-            'Year': self.income['Year'],
-            'Asset_Turnover': self.income['Revenue'] / self.balance['Total_Assets'],
-            'Fixed_Asset_Turnover': self.income['Revenue'] / self.balance['Fixed_Assets']
+            'Year': self._arr.year,
+            'Asset_Turnover': self._get('asset_turnover'),
+            'Fixed_Asset_Turnover': self._get('fixed_asset_turnover'),
+            'Asset_Turnover_Change_%': self._get('asset_turnover_change')
         })
         
-        # Calculate efficiency trend
-        efficiency['Asset_Turnover_Change_%'] = efficiency['Asset_Turnover'].pct_change() * 100
-        
         self.ratios['efficiency'] = efficiency
-        print("✓ Efficiency ratios calculated")
+        log.debug("✓ Efficiency ratios calculated")
         return efficiency
     
-    def analyze_dupont_model(self) -> pd.DataFrame:
+    def analyze_dupont_model(self, scenarios: pd.DataFrame = None) -> pd.DataFrame:
         """
         Perform DuPont analysis to decompose ROE:
         ROE = Net Margin × Asset Turnover × Equity Multiplier
+        
+        scenarios: optional frame of Net_Margin_%, Asset_Turnover and Equity_Multiplier
+        values (e.g. a sensitivity sweep); ROE is calculated for each row instead of
+        for the reported years
         """
-        print("\nPerforming DuPont analysis...")
+        log.debug("Performing DuPont analysis...")
+        
+        if scenarios is not None:
+            dupont = scenarios.copy()
+            _add_dupont_roe(dupont)
+            log.debug("✓ DuPont analysis complete")
+            return dupont
         
         dupont = pd.DataFrame({
-            'Year': self.income['Year'],
-            'Net_Margin_%': (self.income['Net_Income'] / self.income['Revenue']) * 100,
-            'Asset_Turnover': self.income['Revenue'] / self.balance['Total_Assets'],
-            'Equity_Multiplier': self.balance['Total_Assets'] / self.balance['Shareholders_Equity']
+            'Year': self._arr.year,
+            'Net_Margin_%': self._get('net_margin'),
+            'Asset_Turnover': self._get('asset_turnover'),
+            'Equity_Multiplier': self._get('equity_multiplier')
         })
         
         # Calculate ROE from components
-        dupont['ROE_Calculated_%'] = (
-            dupont['Net_Margin_%'] / 100 * 
-            dupont['Asset_Turnover'] * 
-            dupont['Equity_Multiplier']
-        ) * 100
+        _add_dupont_roe(dupont)
         
         # Actual ROE for verification
-        dupont['ROE_Actual_%'] = (self.income['Net_Income'] / self.balance['Shareholders_Equity']) * 100
+        dupont['ROE_Actual_%'] = self._get('roe')
         
-        print("✓ DuPont analysis complete")
+        log.debug("✓ DuPont analysis complete")
         return dupont
     
     def identify_ratio_trends(self) -> Dict:
         """
         Identify positive and negative trends in key ratios
         """
-        print("\nAnalyzing ratio trends...")
+        log.debug("Analyzing ratio trends...")
         
         trends = {
             'improving': [],
@@ -160,42 +424,50 @@ class FinancialRatioAnalyzer:
             'stable': []
         }
         
-        # Analyze each ratio category
+        # Stack every numeric ratio column into one matrix
+        names = []
+        columns = []
         for category, df in self.ratios.items():
-            for col in df.columns:
-                if col != 'Year' and df[col].dtype in ['float64', 'int64']:
-                    values = df[col].dropna()
-                    if len(values) > 1:
-                        # Calculate overall trend
-                        trend = (values.iloc[-1] - values.iloc[0]) / abs(values.iloc[0]) if values.iloc[0] != 0 else 0
-                        
-                        if trend > 0.1:  # 10% improvement
-                            trends['improving'].append(f"{category}.{col}")
-                        elif trend < -0.1:  # 10% decline
-                            trends['declining'].append(f"{category}.{col}")
-                        else:
-                            trends['stable'].append(f"{category}.{col}")
-        
-        print("✓ Trend analysis complete")
+            numeric_cols = df.select_dtypes(include=[np.number]).columns.drop('Year', errors='ignore')
+            for col in numeric_cols:
+                names.append(f"{category}.{col}")
+                columns.append(df[col].to_numpy(dtype=np.float64))
+        
+        if columns:
+            # 10% improvement / decline thresholds
+            codes, counted = _classify_trends(np.column_stack(columns), 0.1)
+            labels = {1: 'improving', -1: 'declining', 0: 'stable'}
+            for name, code, keep in zip(names, codes.tolist(), counted.tolist()):
+                if keep:
+                    trends[labels[code]].append(name)
+        
+        log.debug("✓ Trend analysis complete")
         return trends
     
     def generate_ratio_summary(self) -> pd.DataFrame:
         """
         Generate comprehensive summary of all key ratios
         """
-        print("\nGenerating ratio summary...")
-        
-        summary = pd.DataFrame({
-            'Year': self.income['Year'],
-            'Gross_Margin_%': self.ratios['profitability']['Gross_Margin_%'],
-            'EBIT_Margin_%': self.ratios['profitability']['EBIT_Margin_%'],
-            'ROE_%': self.ratios['profitability']['ROE_%'],
-            'Current_Ratio': self.ratios['liquidity']['Current_Ratio'],
-            'Debt_to_Equity': self.ratios['leverage']['Debt_to_Equity'],
-            'Asset_Turnover': self.ratios['efficiency']['Asset_Turnover']
-        })
+        log.debug("Generating ratio summary...")
+        
+        sources = [
+            ('Gross_Margin_%', 'profitability'),
+            ('EBIT_Margin_%', 'profitability'),
+            ('ROE_%', 'profitability'),
+            ('Current_Ratio', 'liquidity'),
+            ('Debt_to_Equity', 'leverage'),
+            ('Asset_Turnover', 'efficiency')
+        ]
         
-        print("✓ Summary generated")
+        # Row-major block so row-wise consumers read each year contiguously
+        data = np.empty((len(self._arr.year), len(sources)), dtype=np.float64, order='C')
+        for k, (metric, category) in enumerate(sources):
+            data[:, k] = self.ratios[category][metric].to_numpy()
+        
+        summary = pd.DataFrame(data, columns=[metric for metric, _ in sources], copy=False)
+        summary.insert(0, 'Year', self._arr.year)
+        
+        log.debug("✓ Summary generated")
         return summary
     
     def benchmark_against_industry(self, industry_benchmarks: Dict) -> pd.DataFrame:
@@ -203,7 +475,7 @@ class FinancialRatioAnalyzer:
         Compare ratios against industry benchmarks
         Industry benchmarks for UK retail sector
         """
-        print("\nBenchmarking against industry standards...")
+        log.debug("Benchmarking against industry standards...")
         
         # Default industry benchmarks for UK retail
         if not industry_benchmarks:
@@ -219,33 +491,46 @@ class FinancialRatioAnalyzer:
         summary = self.generate_ratio_summary()
         
         # Calculate variance from industry benchmark
-        benchmark_analysis = pd.DataFrame({'Year': summary['Year']})
+        columns = {'Year': summary['Year'].to_numpy()}
         
         for metric, benchmark in industry_benchmarks.items():
             if metric in summary.columns:
-                benchmark_analysis[f"{metric}_vs_Industry"] = summary[metric] - benchmark
-                benchmark_analysis[f"{metric}_Performance"] = benchmark_analysis[f"{metric}_vs_Industry"].apply(
-                    lambda x: 'Above' if x > 0 else 'Below'
-                )
+                diff = summary[metric].to_numpy() - benchmark
+                columns[f"{metric}_vs_Industry"] = diff
+                columns[f"{metric}_Performance"] = np.where(diff > 0, 'Above', 'Below')
+        
+        benchmark_analysis = pd.DataFrame(columns, index=summary.index)
         
-        print("✓ Benchmarking complete")
+        log.debug("✓ Benchmarking complete")
         return benchmark_analysis
     
-    def export_ratios(self, output_path='data/processed/'):
+    def export_ratios(self, output_path='data/processed/', file_format='parquet'):
         """
-        Export all calculated ratios to CSV files
+        Export all calculated ratios, one Snappy-compressed Parquet file per category
+        file_format='csv' writes CSV files instead; CSV is also used when pyarrow is not installed
         """
-        print("\nExporting ratio analysis...")
+        log.info("Exporting ratio analysis...")
         
-        for category, df in self.ratios.items():
-            filename = f"{output_path}ratios_{category}.csv"
-            # df.to_csv(filename, index=False)
-            print(f"✓ Exported {category} ratios to {filename}")
+        if file_format not in ('parquet', 'csv'):
+            raise ValueError(f"Unsupported export format: {file_format}")
+        if file_format == 'parquet' and pa is None:
+            log.info("pyarrow not installed - exporting ratios as CSV")
+            file_format = 'csv'
+        writer = _write_parquet if file_format == 'parquet' else _write_csv
+        
+        jobs = {f"{output_path}ratios_{category}.{file_format}": df for category, df in self.ratios.items()}
+        # _write_batch(jobs, writer)
+        for category, filename in zip(self.ratios, jobs):
+            log.info("✓ Exported %s ratios to %s", category, filename)
         
-        print("\n=== Ratio analysis complete ===")
+        log.info("=== Ratio analysis complete ===")
 
 
 if __name__ == "__main__":
+    # Show progress from every step, not just the export summary
+    logging.basicConfig(format='%(message)s')
+    log.setLevel(logging.DEBUG)
+    
     print("="*60)
     print("House of Fraser Financial Ratio Analysis")
     print("="*60)
@@ -4,92 +4,275 @@ Author: Vinisha Biju
 Description: Create comprehensive visualizations and reports for financial analysis
 """
 
+import os
+import hashlib
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List
 import warnings
-warnings.filterwarnings('ignore')
 
-# Set visualization style
-sns.set_style('whitegrid')
-plt.rcParams['figure.figsize'] = (12, 6)
+def _shrink_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast numeric columns to the smallest dtype holding them (float32, Year -> int16)
+    """
+    downcast = {'f': 'float', 'i': 'integer'}
+    return pd.DataFrame({
+        name: pd.to_numeric(col, downcast=downcast[col.dtype.kind]) if col.dtype.kind in downcast else col
+        for name, col in df.items()
+    }, index=df.index)
+
+
+def _summary_stats(rev: np.ndarray, gross_margin: np.ndarray, ebit_margin: np.ndarray) -> tuple:
+    """
+    Reduce the executive summary inputs to plain floats in one pass over raw ndarrays
+    
+    Returns:
+        (revenue_start, revenue_end, revenue_change, revenue_pct, gross_margin_avg, ebit_margin_end)
+    """
+    start, end = float(rev[0]), float(rev[-1])
+    change = end - start
+    return start, end, change, change / start * 100, float(np.nanmean(gross_margin)), float(ebit_margin[-1])
+
+
+# Executive summary layout, built once at import; only the figures in double braces
+# are left for str.format at call time
+_BANNER = "=" * 70
+_REPORT_TEMPLATE = f"""\
+{_BANNER}
+HOUSE OF FRASER - FINANCIAL ANALYSIS EXECUTIVE SUMMARY
+{_BANNER}
+
+1. REVENUE PERFORMANCE
+   2015 Revenue: £{{revenue_2015:.1f}}M
+   2018 Revenue: £{{revenue_2018:.1f}}M
+   Total Change: £{{revenue_change:.1f}}M ({{revenue_pct:+.1f}}%)
+   Status: SIGNIFICANT DECLINE - requires immediate action
+
+2. PROFITABILITY METRICS
+   Average Gross Margin: {{gross_margin_avg:.1f}}%
+   2018 EBIT Margin: {{ebit_margin_2018:.1f}}%
+   Status: NEGATIVE EBIT in 2018 - profitability crisis
+
+3. KEY FINDINGS
+   • 27% revenue decline in 2018 indicates market share loss
+   • Gross margin compressed from 58.6% to 39.1%
+   • Operating expenses remained fixed despite revenue decline
+   • Negative EBIT signals operational inefficiencies
+
+4. STRATEGIC RECOMMENDATIONS
+   • Implement cost reduction program (target: 12% OpEx reduction)
+   • Accelerate digital transformation initiatives
+   • Launch data-driven personalization campaigns
+   • Optimize inventory management with lean methodologies
+   • Restructure debt and renegotiate supplier contracts
+
+{_BANNER}"""
+
 
 class FinancialVisualizer:
     """
     Generate professional financial visualizations and reports
     """
     
+    # matplotlib/seaborn are imported on first plot so report-only callers never load them
+    plt = None
+    sns = None
+    
+    # Chart colours by role; parsed to RGBA tuples once in _ensure_mpl
+    _COLOR_NAMES = {
+        'revenue': 'skyblue', 'net_income': 'red', 'liquidity': 'green', 'leverage': 'orange',
+        'turnover': 'purple', 'gain': 'green', 'loss': 'red', 'threshold': 'red', 'zero': 'black'
+    }
+    _PALETTE = None
+    
+    @classmethod
+    def _ensure_mpl(cls):
+        """
+        Import pyplot and seaborn once, apply the chart style, and return pyplot
+        """
+        if cls.plt is None:
+            import matplotlib
+            matplotlib.use('Agg')  # Charts are only saved to PNG; skip GUI backend start-up
+            import matplotlib.pyplot as plt
+            from matplotlib import colors as mcolors, font_manager
+            import seaborn as sns
+            
+            # Set visualization style
+            sns.set_style('whitegrid')
+            plt.rcParams['figure.figsize'] = (12, 6)
+            plt.rcParams['figure.dpi'] = 100
+            # Resolve the default font now rather than inside the first set_title call
+            font_manager.findfont('DejaVu Sans')
+            cls._PALETTE = {role: mcolors.to_rgba(name) for role, name in cls._COLOR_NAMES.items()}
+            cls.plt, cls.sns = plt, sns
+        return cls.plt
+    
     def __init__(self, financial_data: Dict[str, pd.DataFrame]):
-        self.data = financial_data
+        # Downcast copies; the caller's frames are left as they are
+        self.data = {name: _shrink_dtypes(df) for name, df in financial_data.items()}
+        # Struct-of-arrays view shared by the charts and report: one ndarray per column,
+        # with the Year column common to both statements kept once
+        self.cols = {}
+        for df in self.data.values():
+            for name in df.columns:
+                self.cols.setdefault(name, df[name].to_numpy(copy=False))
         self.charts = {}
+        self._precompute()
+    
+    def _precompute(self):
+        """
+        Cache the arrays and scalars the charts and report reuse; the data is fixed after __init__
+        """
+        c = self.cols
+        
+        self._years = c['Year']
+        self._rev = c['Revenue']
+        self._growth = c['Revenue_Growth'][1:]  # first year has no prior year
+        self._summary = _summary_stats(self._rev, c['Gross_Margin'], c['EBIT_Margin'])
+        # One (n_years, 3) block for the boxplot, one column per margin
+        self._margins = np.column_stack(
+            [c['Gross_Margin'], c['EBIT_Margin'], c['Net_Margin']]
+        ).astype(np.float32, copy=False)
+    
+    def _chart(self, key: str, nrows=1, ncols=1, figsize=None):
+        """
+        Return the cached (fig, axes) for a chart with its axes cleared, creating it on first use
+        """
+        if key not in self.charts:
+            self.charts[key] = self._ensure_mpl().subplots(nrows, ncols, figsize=figsize, constrained_layout=True)
+        fig, axes = self.charts[key]
+        grid = list(np.ravel(axes))
+        for ax in fig.axes:
+            if ax in grid:
+                ax.clear()
+            else:
+                ax.remove()  # twin axes are recreated by the draw helpers
+        return fig, axes
+    
+    @classmethod
+    def _signed_colors(cls, a, pos='gain', neg='loss'):
+        """
+        Map signed values to palette bar colours in one vectorized pass
+        
+        Returns:
+            (n, 4) RGBA array, the pos colour where a > 0 and the neg colour elsewhere
+        """
+        return np.where((np.asarray(a) > 0)[:, None], cls._PALETTE[pos], cls._PALETTE[neg])
+    
+    @staticmethod
+    def _fast_save(fig, path):
+        """
+        Write the figure's rendered Agg buffer straight to PNG with light compression
+        """
+        from PIL import Image  # installed with matplotlib
+        
+        fig.canvas.draw()
+        # buffer_rgba replaces tostring_rgb, which newer matplotlib releases have dropped
+        Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).convert('RGB').save(path, compress_level=1)
+    
+    def plot_all(self, save_path='outputs/charts/'):
+        """
+        Draw every chart into one 3x3 figure: revenue trend and growth, margins, then the dashboard
+        """
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            fig, axes = self._chart('all', 3, 3, figsize=(20, 15))
+            
+            self._draw_revenue_trend(axes[0, 0], axes[0, 1])
+            self._draw_profitability(axes[0, 2])
+            self._draw_dashboard(axes[1:, :].ravel())
+            
+            # self._fast_save(fig, f'{save_path}financial_overview.png')
+        
+        print("✓ Financial overview chart generated")
         
     def plot_revenue_trend(self, save_path='outputs/charts/'):
         """
         Create revenue trend analysis chart with growth rates
         """
-        income = self.data['income_statement']
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            fig, (ax1, ax2) = self._chart('revenue', 1, 2, figsize=(15, 5))
+            self._draw_revenue_trend(ax1, ax2)
+            
+            # self._fast_save(fig, f'{save_path}revenue_analysis.png')
+        
+        print("✓ Revenue trend chart generated")
+        
+    def plot_profitability_metrics(self, save_path='outputs/charts/'):
+        """
+        Visualize profitability margins over time
+        """
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            fig, ax = self._chart('profitability', figsize=(12, 6))
+            self._draw_profitability(ax)
+            
+            # self._fast_save(fig, f'{save_path}profitability_margins.png')
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 5))
+        print("✓ Profitability metrics chart generated")
         
+    def plot_financial_health_dashboard(self, save_path='outputs/charts/'):
+        """
+        Create comprehensive financial health dashboard
+        """
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            fig, axes = self._chart('dashboard', 2, 3, figsize=(16, 10))
+            self._draw_dashboard(axes.ravel())
+            
+            # self._fast_save(fig, f'{save_path}financial_dashboard.png')
+        
+        print("✓ Financial health dashboard generated")
+        
+    def _draw_revenue_trend(self, ax1, ax2):
+        """
+        Draw the revenue line onto ax1 and year-over-year growth bars onto ax2
+        """
         # Revenue trend
-        ax1.plot(income['Year'], income['Revenue'], marker='o', linewidth=2, markersize=8)
+        ax1.plot(self._years, self._rev, marker='o', linewidth=2, markersize=8)
         ax1.set_title('Revenue Trend (2015-2018)', fontsize=14, fontweight='bold')
         ax1.set_xlabel('Year')
         ax1.set_ylabel('Revenue (£M)')
         ax1.grid(True, alpha=0.3)
         
         # Revenue growth rates
-        colors = ['green' if x > 0 else 'red' for x in income['Revenue_Growth'].dropna()]
-        ax2.bar(income['Year'][1:], income['Revenue_Growth'].dropna(), color=colors)
+        ax2.bar(self._years[1:], self._growth, color=self._signed_colors(self._growth))
         ax2.set_title('Year-over-Year Revenue Growth', fontsize=14, fontweight='bold')
         ax2.set_xlabel('Year')
         ax2.set_ylabel('Growth Rate (%)')
-        ax2.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
+        ax2.axhline(y=0, color=self._PALETTE['zero'], linestyle='-', linewidth=0.5)
         ax2.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        # plt.savefig(f'{save_path}revenue_analysis.png', dpi=300, bbox_inches='tight')
-        print("✓ Revenue trend chart generated")
-        
-    def plot_profitability_metrics(self, save_path='outputs/charts/'):
+    def _draw_profitability(self, ax):
         """
-        Visualize profitability margins over time
+        Draw the gross, EBIT and net margin lines onto ax
         """
-        income = self.data['income_statement']
-        
-        fig, ax = plt.subplots(figsize=(12, 6))
+        c = self.cols
         
-        ax.plot(income['Year'], income['Gross_Margin'], marker='o', label='Gross Margin', linewidth=2)
-        ax.plot(income['Year'], income['EBIT_Margin'], marker='s', label='EBIT Margin', linewidth=2)
-        ax.plot(income['Year'], income['Net_Margin'], marker='^', label='Net Margin', linewidth=2)
+        ax.plot(self._years, c['Gross_Margin'], marker='o', label='Gross Margin', linewidth=2)
+        ax.plot(self._years, c['EBIT_Margin'], marker='s', label='EBIT Margin', linewidth=2)
+        ax.plot(self._years, c['Net_Margin'], marker='^', label='Net Margin', linewidth=2)
         
         ax.set_title('Profitability Margins Trend', fontsize=14, fontweight='bold')
         ax.set_xlabel('Year')
         ax.set_ylabel('Margin (%)')
         ax.legend()
         ax.grid(True, alpha=0.3)
-        ax.axhline(y=0, color='red', linestyle='--', linewidth=1, alpha=0.5)
+        ax.axhline(y=0, color=self._PALETTE['threshold'], linestyle='--', linewidth=1, alpha=0.5)
         
-        plt.tight_layout()
-        # plt.savefig(f'{save_path}profitability_margins.png', dpi=300, bbox_inches='tight')
-        print("✓ Profitability metrics chart generated")
-        
-    def plot_financial_health_dashboard(self, save_path='outputs/charts/'):
+    def _draw_dashboard(self, axes):
         """
-        Create comprehensive financial health dashboard
+        Draw the six financial health panels onto axes (any 6 Axes, in reading order)
         """
-        income = self.data['income_statement']
-        balance = self.data['balance_sheet']
-        
-        fig = plt.figure(figsize=(16, 10))
+        c = self.cols
+        ax1, ax2, ax3, ax4, ax5, ax6 = axes
         
         # Revenue and Net Income
-        ax1 = plt.subplot(2, 3, 1)
         ax1_twin = ax1.twinx()
-        ax1.bar(income['Year'], income['Revenue'], alpha=0.7, color='skyblue', label='Revenue')
-        ax1_twin.plot(income['Year'], income['Net_Income'], marker='o', color='red', label='Net Income', linewidth=2)
+        ax1.bar(self._years, self._rev, color=self._PALETTE['revenue'], label='Revenue')
+        ax1_twin.plot(self._years, c['Net_Income'], marker='o', color=self._PALETTE['net_income'], label='Net Income', linewidth=2)
         ax1.set_title('Revenue vs Net Income', fontweight='bold')
         ax1.set_ylabel('Revenue (£M)')
         ax1_twin.set_ylabel('Net Income (£M)')
@@ -97,116 +280,98 @@ class FinancialVisualizer:
         ax1_twin.legend(loc='upper right')
         
         # Asset breakdown
-        ax2 = plt.subplot(2, 3, 2)
-        x = np.arange(len(balance['Year']))
+        x = np.arange(len(self._years))
         width = 0.35
-        ax2.bar(x - width/2, balance['Current_Assets'], width, label='Current Assets', alpha=0.8)
-        ax2.bar(x + width/2, balance['Fixed_Assets'], width, label='Fixed Assets', alpha=0.8)
+        ax2.bar(x - width/2, c['Current_Assets'], width, label='Current Assets')
+        ax2.bar(x + width/2, c['Fixed_Assets'], width, label='Fixed Assets')
         ax2.set_title('Asset Composition', fontweight='bold')
         ax2.set_xticks(x)
-        ax2.set_xticklabels(balance['Year'])
+        ax2.set_xticklabels(self._years)
         ax2.set_ylabel('Assets (£M)')
         ax2.legend()
         
         # Liquidity ratio
-        ax3 = plt.subplot(2, 3, 3)
-        ax3.plot(balance['Year'], balance['Current_Ratio'], marker='o', linewidth=2, color='green')
-        ax3.axhline(y=1.0, color='red', linestyle='--', label='Threshold')
+        ax3.plot(self._years, c['Current_Ratio'], marker='o', linewidth=2, color=self._PALETTE['liquidity'])
+        ax3.axhline(y=1.0, color=self._PALETTE['threshold'], linestyle='--', label='Threshold')
         ax3.set_title('Current Ratio Trend', fontweight='bold')
         ax3.set_ylabel('Current Ratio')
         ax3.legend()
         ax3.grid(True, alpha=0.3)
         
         # Debt to Equity
-        ax4 = plt.subplot(2, 3, 4)
-        ax4.plot(balance['Year'], balance['Debt_to_Equity'], marker='s', linewidth=2, color='orange')
+        ax4.plot(self._years, c['Debt_to_Equity'], marker='s', linewidth=2, color=self._PALETTE['leverage'])
         ax4.set_title('Leverage Ratio (Debt/Equity)', fontweight='bold')
         ax4.set_ylabel('Debt-to-Equity Ratio')
         ax4.grid(True, alpha=0.3)
         
         # Margin trends
-        ax5 = plt.subplot(2, 3, 5)
-        margins_data = [income['Gross_Margin'], income['EBIT_Margin'], income['Net_Margin']]
-        ax5.boxplot(margins_data, labels=['Gross', 'EBIT', 'Net'])
+        ax5.boxplot(self._margins, labels=['Gross', 'EBIT', 'Net'])
         ax5.set_title('Margin Distribution', fontweight='bold')
         ax5.set_ylabel('Margin (%)')
         ax5.grid(True, alpha=0.3)
         
         # Asset Turnover
-        ax6 = plt.subplot(2, 3, 6)
-        ax6.bar(balance['Year'], balance['Asset_Turnover'], color='purple', alpha=0.7)
+        ax6.bar(self._years, c['Asset_Turnover'], color=self._PALETTE['turnover'])
         ax6.set_title('Asset Turnover Efficiency', fontweight='bold')
         ax6.set_ylabel('Asset Turnover Ratio')
         ax6.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        # plt.savefig(f'{save_path}financial_dashboard.png', dpi=300, bbox_inches='tight')
-        print("✓ Financial health dashboard generated")
-        
+    
     def generate_executive_summary_report(self) -> str:
         """
         Generate text-based executive summary report
         """
-        income = self.data['income_statement']
-        
-        report = []
-        report.append("="*70)
-        report.append("HOUSE OF FRASER - FINANCIAL ANALYSIS EXECUTIVE SUMMARY")
-        report.append("="*70)
-        report.append("")
-        
-        # Revenue analysis
-        revenue_2015 = income['Revenue'].iloc[0]
-        revenue_2018 = income['Revenue'].iloc[-1]
-        revenue_change = revenue_2018 - revenue_2015
-        revenue_pct = (revenue_change / revenue_2015) * 100
-        
-        report.append("1. REVENUE PERFORMANCE")
-        report.append(f"   2015 Revenue: £{revenue_2015:.1f}M")
-        report.append(f"   2018 Revenue: £{revenue_2018:.1f}M")
-        report.append(f"   Total Change: £{revenue_change:.1f}M ({revenue_pct:+.1f}%)")
-        report.append("   Status: SIGNIFICANT DECLINE - requires immediate action")
-        report.append("")
-        
-        # Profitability
-        gross_margin_avg = income['Gross_Margin'].mean()
-        ebit_margin_2018 = income['EBIT_Margin'].iloc[-1]
-        
-        report.append("2. PROFITABILITY METRICS")
-        report.append(f"   Average Gross Margin: {gross_margin_avg:.1f}%")
-        report.append(f"   2018 EBIT Margin: {ebit_margin_2018:.1f}%")
-        report.append("   Status: NEGATIVE EBIT in 2018 - profitability crisis")
-        report.append("")
-        
-        # Key findings
-        report.append("3. KEY FINDINGS")
-        report.append("   • 27% revenue decline in 2018 indicates market share loss")
-        report.append("   • Gross margin compressed from 58.6% to 39.1%")
-        report.append("   • Operating expenses remained fixed despite revenue decline")
-        report.append("   • Negative EBIT signals operational inefficiencies")
-        report.append("")
-        
-        # Recommendations
-        report.append("4. STRATEGIC RECOMMENDATIONS")
-        report.append("   • Implement cost reduction program (target: 12% OpEx reduction)")
-        report.append("   • Accelerate digital transformation initiatives")
-        report.append("   • Launch data-driven personalization campaigns")
-        report.append("   • Optimize inventory management with lean methodologies")
-        report.append("   • Restructure debt and renegotiate supplier contracts")
-        report.append("")
-        report.append("="*70)
+        (revenue_2015, revenue_2018, revenue_change, revenue_pct,
+         gross_margin_avg, ebit_margin_2018) = self._summary
+        
+        return _REPORT_TEMPLATE.format(
+            revenue_2015=revenue_2015,
+            revenue_2018=revenue_2018,
+            revenue_change=revenue_change,
+            revenue_pct=revenue_pct,
+            gross_margin_avg=gross_margin_avg,
+            ebit_margin_2018=ebit_margin_2018
+        )
+    
+    def _data_fingerprint(self) -> str:
+        """
+        Hash every column's name, dtype and bytes into a 16-byte blake2b digest
         
-        return "\n".join(report)
+        Returns:
+            Hex digest that changes whenever any input value changes
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for name in sorted(self.cols):
+            col = np.ascontiguousarray(self.cols[name])
+            digest.update(f'{name}:{col.dtype.str}'.encode())
+            digest.update(col.tobytes())
+        return digest.hexdigest()
     
-    def export_all_visualizations(self, output_path='outputs/charts/'):
+    def export_all_visualizations(self, output_path='outputs/charts/', workers=None):
         """
         Generate and export all visualization charts
+        
+        With workers set, the three individual charts are rendered in a process pool
+        instead of the single combined figure
         """
         print("\nGenerating all visualizations...")
         
-        self.plot_revenue_trend(output_path)
-        self.plot_profitability_metrics(output_path)
-        self.plot_financial_health_dashboard(output_path)
+        # Skip the render when the charts on disk were produced from identical data
+        fingerprint = self._data_fingerprint()
+        names = _CHART_FILES if workers else ('financial_overview',)
+        charts = [f'{output_path}{name}.png' for name in names]
+        if os.path.exists(f'{output_path}.fingerprint') and all(os.path.exists(c) for c in charts):
+            with open(f'{output_path}.fingerprint') as f:
+                if f.read() == fingerprint:
+                    print(f"✓ Charts in {output_path} are up to date")
+                    return
+        
+        if workers:
+            jobs = [(self.data, method, output_path) for method in _CHART_METHODS]
+            with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+                list(pool.map(_render_chart, jobs))
+        else:
+            # One figure, one layout pass and one save for every chart
+            self.plot_all(output_path)
         
         # Generate executive summary
         summary = self.generate_executive_summary_report()
@@ -214,11 +379,31 @@ class FinancialVisualizer:
         
         # with open(f'{output_path}executive_summary.txt', 'w') as f:
         #     f.write(summary)
+        # with open(f'{output_path}.fingerprint', 'w') as f:
+        #     f.write(fingerprint)
+        
+        # Drop pyplot's references; the cached figures stay usable for the next export
+        if self.plt is not None:
+            self.plt.close('all')
         
         print("\n✓ All visualizations exported successfully")
         print(f"\nCharts saved to: {output_path}")
 
 
+
+# Individual chart renderers dispatched by export_all_visualizations(workers=...)
+_CHART_METHODS = ('plot_revenue_trend', 'plot_profitability_metrics', 'plot_financial_health_dashboard')
+_CHART_FILES = ('revenue_analysis', 'profitability_margins', 'financial_dashboard')
+
+
+def _render_chart(job):
+    """
+    Process-pool worker: build a visualizer from (financial_data, method, output_path) and render one chart
+    """
+    financial_data, method, output_path = job
+    getattr(FinancialVisualizer(financial_data), method)(output_path)
+
+
 if __name__ == "__main__":
     print("="*60)
     print("House of Fraser Financial Visualization & Reporting")